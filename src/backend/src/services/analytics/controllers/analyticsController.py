@@ -9,34 +9,74 @@ pandas==2.0.0
 numpy==1.24.0
 """
 
+import asyncio
+import functools
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from ..utils.jsonUtils import AnalyticsJSONResponse
 import pandas as pd
 import numpy as np
 
 # Import internal dependencies
-from ..models.analyticsModel import AnalyticsModel
+from ..models.analyticsModel import AnalyticsModel, get_analytics_model
+from ..utils.cacheUtils import cached
+from ..utils.workerPool import run_cpu_bound
 from ..utils.dataProcessing import (
     process_location_data,
     calculate_fleet_metrics,
+    compute_delivery_time_distributions,
+    compute_hourly_means,
+    compute_vehicle_performance_metrics,
     analyze_delivery_efficiency,
     generate_performance_report
 )
 
-# Initialize router with prefix and tags
+# Initialize router with prefix and tags; orjson serializes the numeric-heavy
+# statistics payloads in C rather than walking them with the stdlib encoder
 # Addresses requirement: RESTful API endpoints for analytics
-router = APIRouter(prefix='/analytics', tags=['analytics'])
+router = APIRouter(
+    prefix='/analytics',
+    tags=['analytics'],
+    default_response_class=AnalyticsJSONResponse
+)
+
+# Shared analytics model, resolved lazily so importing this module does not
+# open connections or re-issue index builds in every uvicorn worker
+analytics_model: Optional[AnalyticsModel] = None
+
+def get_model() -> AnalyticsModel:
+    """Return the shared analytics model, creating it on first use."""
+    global analytics_model
+    if analytics_model is None:
+        analytics_model = get_analytics_model()
+    return analytics_model
 
-# Initialize analytics model with database configuration
-# Connection details should be provided through environment variables
-analytics_model = AnalyticsModel(
-    connection_uri=os.getenv('MONGODB_URI'),
-    database_name=os.getenv('ANALYTICS_DB_NAME')
+# Precompiled ISO-8601 shape check: matching the digit groups and slicing them
+# into ints skips fromisoformat's general-format parsing on the hot path, and
+# the LRU cache absorbs the heavy repetition of dashboard-poll time bounds.
+# Anchored so fractional seconds, UTC offsets and trailing garbage fall
+# through to the general parser instead of being silently discarded
+_ISO_TIMESTAMP_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2}))?$'
 )
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp into a datetime.
+
+    Plain date and date-time shapes take the precompiled fast path; anything
+    else (fractional seconds, timezone offsets) goes through fromisoformat,
+    which honors offsets. Raises ValueError for strings that are not valid
+    ISO-8601 or encode an invalid calendar date.
+    """
+    match = _ISO_TIMESTAMP_RE.match(value)
+    if match:
+        return datetime(*(int(group) for group in match.groups('0')))
+    return datetime.fromisoformat(value)
+
 # Custom exception handler decorator
 def handle_exceptions(func):
     """Decorator for consistent error handling across endpoints."""
@@ -56,7 +96,7 @@ def handle_exceptions(func):
 async def get_fleet_analytics(
     time_range: Dict,
     metrics: Optional[List[str]] = None
-) -> JSONResponse:
+) -> AnalyticsJSONResponse:
     """
     Retrieve comprehensive fleet analytics for specified time period.
     Addresses requirements:
@@ -68,12 +108,12 @@ async def get_fleet_analytics(
         metrics (List[str], optional): Specific metrics to include
     
     Returns:
-        JSONResponse: Fleet analytics data including performance metrics
+        AnalyticsJSONResponse: Fleet analytics data including performance metrics
     """
     # Validate time range
     try:
-        start_time = datetime.fromisoformat(time_range.get('start'))
-        end_time = datetime.fromisoformat(time_range.get('end'))
+        start_time = _parse_iso_timestamp(time_range.get('start'))
+        end_time = _parse_iso_timestamp(time_range.get('end'))
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=400,
@@ -84,17 +124,28 @@ async def get_fleet_analytics(
     if not metrics:
         metrics = ['speed', 'distance', 'fuel_consumption', 'idle_time']
 
-    # Retrieve fleet performance data
-    fleet_performance = analytics_model.get_fleet_performance(
-        time_range={'start': start_time, 'end': end_time},
-        metrics_to_include=metrics
-    )
+    # Retrieve fleet performance data: each metric aggregates independently,
+    # so the per-metric queries run concurrently on executor threads instead
+    # of blocking the event loop one after another
+    loop = asyncio.get_event_loop()
+    per_metric = await asyncio.gather(*[
+        loop.run_in_executor(None, functools.partial(
+            get_model().get_fleet_performance,
+            time_range={'start': start_time, 'end': end_time},
+            metrics_to_include=[metric]
+        ))
+        for metric in metrics
+    ])
+    fleet_performance = {}
+    for result in per_metric:
+        fleet_performance.update(result)
 
-    # Calculate fleet metrics with optimized processing
-    fleet_metrics = calculate_fleet_metrics(
+    # Calculate fleet metrics off-loop in the worker pool
+    fleet_metrics = await run_cpu_bound(
+        calculate_fleet_metrics,
         pd.DataFrame(fleet_performance),
-        metric_type='performance',
-        aggregation_period='1D'
+        'performance',
+        '1D'
     )
 
     # Aggregate results with efficient data structures
@@ -103,25 +154,25 @@ async def get_fleet_analytics(
             'start': start_time.isoformat(),
             'end': end_time.isoformat()
         },
-        'fleet_performance': fleet_performance,
         'fleet_metrics': fleet_metrics,
+        # Summary statistics are computed server-side in the aggregation pipeline
         'summary_statistics': {
             metric: {
-                'average': np.mean(values),
-                'median': np.median(values),
-                'std_dev': np.std(values)
-            } for metric, values in fleet_metrics['statistics'].items()
+                'average': stats['average'],
+                'median': stats['median'],
+                'std_dev': stats['standard_deviation']
+            } for metric, stats in fleet_performance.items()
         }
     }
 
-    return JSONResponse(content=response_data)
+    return AnalyticsJSONResponse(content=response_data)
 
 @router.get('/vehicle/{vehicle_id}')
 @handle_exceptions
 async def get_vehicle_analytics(
     vehicle_id: str,
     time_range: Dict
-) -> JSONResponse:
+) -> AnalyticsJSONResponse:
     """
     Retrieve analytics for a specific vehicle with efficient data processing.
     Addresses requirements:
@@ -133,44 +184,36 @@ async def get_vehicle_analytics(
         time_range (Dict): Time range for analysis
     
     Returns:
-        JSONResponse: Vehicle-specific analytics and performance metrics
+        AnalyticsJSONResponse: Vehicle-specific analytics and performance metrics
     """
     # Validate time range
     try:
-        start_time = datetime.fromisoformat(time_range.get('start'))
-        end_time = datetime.fromisoformat(time_range.get('end'))
+        start_time = _parse_iso_timestamp(time_range.get('start'))
+        end_time = _parse_iso_timestamp(time_range.get('end'))
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=400,
             detail="Invalid time range format"
         )
 
-    # Retrieve vehicle metrics
-    vehicle_metrics = analytics_model.get_metrics_by_vehicle(
+    # Retrieve vehicle metrics asynchronously, projecting only the fields the
+    # location pipeline reads so unused ones never leave Mongo
+    vehicle_metrics = await get_model().get_metrics_by_vehicle(
         vehicle_id=vehicle_id,
         time_range={'start': start_time, 'end': end_time},
-        metric_types=['speed', 'distance', 'fuel', 'idle_time']
+        metric_types=['speed', 'distance', 'fuel', 'idle_time'],
+        columns=['timestamp', 'data.vehicle_id', 'data.latitude', 'data.longitude']
     )
 
-    # Process location data with optimized operations
-    processed_data = process_location_data(
+    # Process location data off-loop in the worker pool
+    processed_data = await run_cpu_bound(
+        process_location_data,
         vehicle_metrics,
-        calculation_options={'remove_outliers': True}
+        {'remove_outliers': True}
     )
 
-    # Calculate performance indicators
-    performance_metrics = {
-        'total_distance': float(processed_data['distance'].sum()),
-        'average_speed': float(processed_data['speed'].mean()),
-        'max_speed': float(processed_data['speed'].max()),
-        'idle_time_percentage': float(
-            (processed_data['speed'] < 1).mean() * 100
-        ),
-        'acceleration_profile': {
-            'average': float(processed_data['acceleration'].mean()),
-            'std_dev': float(processed_data['acceleration'].std())
-        }
-    }
+    # Calculate performance indicators in a single pass over numpy arrays
+    performance_metrics = compute_vehicle_performance_metrics(processed_data)
 
     response_data = {
         'vehicle_id': vehicle_id,
@@ -179,17 +222,21 @@ async def get_vehicle_analytics(
             'end': end_time.isoformat()
         },
         'performance_metrics': performance_metrics,
-        'hourly_statistics': processed_data.resample('1H').mean().to_dict()
+        'hourly_statistics': compute_hourly_means(
+            processed_data,
+            time_range={'start': start_time, 'end': end_time}
+        )
     }
 
-    return JSONResponse(content=response_data)
+    return AnalyticsJSONResponse(content=response_data)
 
 @router.get('/delivery')
 @handle_exceptions
 async def get_delivery_analytics(
     time_range: Dict,
-    efficiency_parameters: Dict
-) -> JSONResponse:
+    efficiency_parameters: Dict,
+    vehicle_ids: Optional[List[str]] = None
+) -> AnalyticsJSONResponse:
     """
     Analyze delivery performance and efficiency metrics.
     Addresses requirements:
@@ -199,10 +246,22 @@ async def get_delivery_analytics(
     Args:
         time_range (Dict): Time range for analysis
         efficiency_parameters (Dict): Parameters for efficiency calculations
-    
+        vehicle_ids (List[str], optional): Restrict analysis to these vehicles;
+            defaults to the whole fleet
+
     Returns:
-        JSONResponse: Delivery performance analytics and efficiency scores
+        AnalyticsJSONResponse: Delivery performance analytics and efficiency scores
     """
+    # Validate time range
+    try:
+        start_time = _parse_iso_timestamp(time_range.get('start'))
+        end_time = _parse_iso_timestamp(time_range.get('end'))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid time range format"
+        )
+
     # Validate parameters
     if not all(key in efficiency_parameters for key in ['target_on_time', 'target_utilization']):
         raise HTTPException(
@@ -210,11 +269,18 @@ async def get_delivery_analytics(
             detail="Missing required efficiency parameters"
         )
 
-    # Retrieve delivery data for analysis
-    delivery_metrics = analytics_model.get_metrics_by_vehicle(
-        vehicle_id='all',
-        time_range=time_range,
-        metric_types=['delivery_time', 'distance', 'fuel_consumption']
+    # Retrieve delivery data for analysis, batching vehicles into one query
+    # and projecting only the fields the efficiency analysis consumes
+    delivery_metrics = await get_model().get_metrics_by_vehicle(
+        vehicle_id=vehicle_ids,
+        time_range={'start': start_time, 'end': end_time},
+        metric_types=['delivery_time', 'distance', 'fuel_consumption'],
+        columns=[
+            'timestamp', 'data.vehicle_id', 'data.delivery_time',
+            'data.actual_time', 'data.planned_time', 'data.distance',
+            'data.actual_distance', 'data.planned_distance',
+            'data.fuel_consumption', 'data.route_id', 'data.stop_count'
+        ]
     )
 
     # Analyze delivery efficiency
@@ -224,26 +290,23 @@ async def get_delivery_analytics(
     )
 
     response_data = {
-        'time_range': time_range,
+        'time_range': {
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        },
         'efficiency_analysis': efficiency_analysis,
-        'delivery_patterns': {
-            'hourly_distribution': delivery_metrics.groupby(
-                delivery_metrics['timestamp'].dt.hour
-            )['delivery_time'].mean().to_dict(),
-            'daily_distribution': delivery_metrics.groupby(
-                delivery_metrics['timestamp'].dt.dayofweek
-            )['delivery_time'].mean().to_dict()
-        }
+        'delivery_patterns': compute_delivery_time_distributions(delivery_metrics)
     }
 
-    return JSONResponse(content=response_data)
+    return AnalyticsJSONResponse(content=response_data)
 
 @router.post('/report')
 @handle_exceptions
+@cached(namespace='report', ttl=30)
 async def generate_analytics_report(
     report_type: str,
     report_parameters: Dict
-) -> JSONResponse:
+) -> AnalyticsJSONResponse:
     """
     Generate comprehensive analytics report with statistical analysis.
     Addresses requirements:
@@ -255,7 +318,7 @@ async def generate_analytics_report(
         report_parameters (Dict): Parameters for report generation
     
     Returns:
-        JSONResponse: Formatted analytics report with comprehensive metrics
+        AnalyticsJSONResponse: Formatted analytics report with comprehensive metrics
     """
     # Validate report type
     valid_report_types = ['fleet_performance', 'delivery_efficiency', 'resource_utilization']
@@ -265,16 +328,32 @@ async def generate_analytics_report(
             detail=f"Invalid report type. Must be one of: {valid_report_types}"
         )
 
-    # Retrieve metrics for report generation
-    metrics_data = analytics_model.get_fleet_performance(
-        time_range=report_parameters.get('time_range'),
+    # Validate time range: the model compares against BSON dates, so the ISO
+    # strings in the parameters must become datetimes before the query
+    time_range = report_parameters.get('time_range') or {}
+    try:
+        start_time = _parse_iso_timestamp(time_range.get('start'))
+        end_time = _parse_iso_timestamp(time_range.get('end'))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid time range format"
+        )
+
+    # Retrieve metrics on an executor thread so the blocking pymongo call
+    # does not stall the event loop while the report job runs
+    loop = asyncio.get_event_loop()
+    metrics_data = await loop.run_in_executor(None, functools.partial(
+        get_model().get_fleet_performance,
+        time_range={'start': start_time, 'end': end_time},
         metrics_to_include=report_parameters.get('metrics', [])
-    )
+    ))
 
-    # Generate performance report
-    report = generate_performance_report(
-        metrics_data=metrics_data,
-        report_type=report_type
+    # Generate the pandas-heavy report off-loop in the worker pool
+    report = await run_cpu_bound(
+        generate_performance_report,
+        metrics_data,
+        report_type
     )
 
     response_data = {
@@ -282,10 +361,13 @@ async def generate_analytics_report(
         'generated_at': datetime.utcnow().isoformat(),
         'report_data': report,
         'metadata': {
-            'time_range': report_parameters.get('time_range'),
+            'time_range': {
+                'start': start_time.isoformat(),
+                'end': end_time.isoformat()
+            },
             'metrics_included': report_parameters.get('metrics', []),
             'data_points_processed': len(metrics_data)
         }
     }
 
-    return JSONResponse(content=response_data)
\ No newline at end of file
+    return AnalyticsJSONResponse(content=response_data)
\ No newline at end of file
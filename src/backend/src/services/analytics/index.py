@@ -17,17 +17,24 @@ python-json-logger==2.0.7
 # 6. Configure rate limiting based on expected load
 
 import os
+import asyncio
 import logging
+import uuid
+import zlib
 from logging.handlers import RotatingFileHandler
+from typing import Optional
 from pythonjsonlogger import jsonlogger
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from .utils.jsonUtils import AnalyticsJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
 import uvicorn
 
 # Import required components
-from .models.analyticsModel import AnalyticsModel
+from .models.analyticsModel import AnalyticsModel, get_analytics_model
 from .routes.analyticsRoutes import router
+from .utils.cacheUtils import initialize_cache, close_cache
+from .utils.workerPool import initialize_worker_pool, shutdown_worker_pool
 from .utils.dataProcessing import process_location_data, calculate_fleet_metrics
 
 # Initialize FastAPI application with OpenAPI documentation
@@ -35,7 +42,8 @@ app = FastAPI(
     title='Fleet Analytics Service',
     version='1.0.0',
     docs_url='/api/v1/analytics/docs',
-    redoc_url='/api/v1/analytics/redoc'
+    redoc_url='/api/v1/analytics/redoc',
+    default_response_class=AnalyticsJSONResponse
 )
 
 # Initialize logger
@@ -69,6 +77,68 @@ def configure_logging():
     # Add performance logging
     logging.getLogger('uvicorn.access').handlers = [log_handler]
 
+class AnalyticsMiddleware:
+    """
+    Single ASGI middleware combining request-id tagging, cache-control headers
+    and gzip compression, replacing three separate per-request middleware
+    dispatches with one.
+    Addresses requirement: Support for 10,000+ concurrent users
+    """
+
+    def __init__(self, app, minimum_size: int = 1000, compress_level: int = 1):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compress_level = compress_level
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        # uuid4().hex skips the dash formatting of str(uuid4())
+        request_id = request_headers.get('x-request-id', uuid.uuid4().hex)
+        accepts_gzip = 'gzip' in request_headers.get('accept-encoding', '')
+        method = scope['method']
+
+        start_message = None
+        body_chunks = []
+
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message['type'] == 'http.response.start':
+                start_message = message
+                return
+
+            if message['type'] == 'http.response.body':
+                body_chunks.append(message.get('body', b''))
+                if message.get('more_body'):
+                    return
+
+                body = b''.join(body_chunks)
+                headers = MutableHeaders(raw=start_message['headers'])
+                headers['X-Request-ID'] = request_id
+                if method in ('GET', 'HEAD'):
+                    headers['Cache-Control'] = 'public, max-age=30'
+
+                if (accepts_gzip and len(body) >= self.minimum_size
+                        and 'content-encoding' not in headers):
+                    compressor = zlib.compressobj(
+                        self.compress_level, zlib.DEFLATED, 31  # wbits=31: gzip container
+                    )
+                    body = compressor.compress(body) + compressor.flush()
+                    headers['Content-Encoding'] = 'gzip'
+                    headers['Vary'] = 'Accept-Encoding'
+
+                headers['Content-Length'] = str(len(body))
+                await send(start_message)
+                await send({'type': 'http.response.body', 'body': body})
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
 def configure_middleware():
     """
     Configures FastAPI middleware for high-performance request handling.
@@ -83,29 +153,9 @@ def configure_middleware():
         allow_headers=["*"],
         expose_headers=["*"]
     )
-    
-    # Add custom middleware for request tracking
-    @app.middleware("http")
-    async def add_request_id(request, call_next):
-        request_id = request.headers.get('X-Request-ID', str(uuid.uuid4()))
-        with logger.contextvars.bind(request_id=request_id):
-            response = await call_next(request)
-            response.headers['X-Request-ID'] = request_id
-            return response
-    
-    # Add response compression middleware
-    app.add_middleware(
-        GZipMiddleware,
-        minimum_size=1000
-    )
-    
-    # Add cache control headers middleware
-    @app.middleware("http")
-    async def add_cache_control(request, call_next):
-        response = await call_next(request)
-        if request.method in ["GET", "HEAD"]:
-            response.headers["Cache-Control"] = "public, max-age=30"
-        return response
+
+    # Single consolidated middleware: request id + cache control + gzip
+    app.add_middleware(AnalyticsMiddleware, minimum_size=1000)
 
 def configure_routes():
     """
@@ -125,17 +175,43 @@ def configure_routes():
         try:
             # Verify database connection
             analytics_model.verify_connection()
-            return JSONResponse(
+            return AnalyticsJSONResponse(
                 content={"status": "healthy", "service": "analytics"},
                 status_code=200
             )
         except Exception as e:
             logger.error(f"Health check failed: {str(e)}")
-            return JSONResponse(
+            return AnalyticsJSONResponse(
                 content={"status": "unhealthy", "service": "analytics"},
                 status_code=503
             )
 
+# Interval between rollup materialization runs in seconds
+ROLLUP_INTERVAL_SECONDS = 60
+
+# Bound at module scope so the shutdown handler can check them even when
+# startup failed before either was assigned
+analytics_model: Optional[AnalyticsModel] = None
+rollup_task: Optional[asyncio.Task] = None
+
+async def schedule_rollup_materialization():
+    """
+    Background task keeping pre-aggregated rollup buckets fresh.
+    Materializes minute-level rollups every cycle and hourly rollups once per hour
+    so fleet performance queries can sum small buckets instead of scanning raw metrics.
+    """
+    cycle = 0
+    while True:
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, analytics_model.materialize_rollups, 'minute')
+            if cycle % 60 == 0:
+                await loop.run_in_executor(None, analytics_model.materialize_rollups, 'hour')
+        except Exception as e:
+            logger.error(f"Rollup materialization failed: {str(e)}")
+        cycle += 1
+        await asyncio.sleep(ROLLUP_INTERVAL_SECONDS)
+
 @app.on_event("startup")
 async def startup_handler():
     """
@@ -147,23 +223,24 @@ async def startup_handler():
         configure_logging()
         logger.info("Starting Analytics Service")
         
-        # Initialize analytics model with MongoDB connection
+        # Initialize the shared analytics model (lazy singleton, one per worker)
         global analytics_model
-        analytics_model = AnalyticsModel(
-            os.getenv('MONGODB_URI'),
-            os.getenv('DB_NAME')
-        )
-        
-        # Verify database connection and indexes
-        analytics_model.verify_connection()
+        analytics_model = get_analytics_model()
+
+        # Prefill the connection pool so first requests skip handshake latency
+        await analytics_model.warm_connection_pool()
         logger.info("Database connection established")
         
-        # Initialize cache connections if needed
-        # cache.initialize()
-        
-        # Set up background task workers for data processing
-        # worker_pool.initialize()
-        
+        # Initialize Redis cache for hot analytics endpoints
+        await initialize_cache()
+
+        # Set up process pool for CPU-heavy pandas/numpy work
+        initialize_worker_pool()
+
+        # Set up background rollup materialization for pre-aggregated queries
+        global rollup_task
+        rollup_task = asyncio.create_task(schedule_rollup_materialization())
+
         logger.info("Analytics Service started successfully")
         
     except Exception as e:
@@ -177,16 +254,21 @@ async def shutdown_handler():
     """
     try:
         logger.info("Shutting down Analytics Service")
-        
+
+        # Stop background rollup materialization
+        if rollup_task:
+            rollup_task.cancel()
+
         # Close database connections
         if analytics_model:
             analytics_model._client.close()
+            analytics_model._async_client.close()
         
         # Shutdown background workers
-        # await worker_pool.shutdown()
-        
+        shutdown_worker_pool()
+
         # Close cache connections
-        # await cache.close()
+        await close_cache()
         
         # Flush pending logs
         for handler in logger.handlers:
@@ -204,7 +286,7 @@ async def shutdown_handler():
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors"""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return AnalyticsJSONResponse(
         status_code=500,
         content={
             "status": "error",
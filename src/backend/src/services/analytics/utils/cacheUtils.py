@@ -0,0 +1,151 @@
+"""
+Redis-backed response caching utilities for the analytics service.
+Provides a shared cache layer so repeated dashboard polls are served from Redis
+instead of re-running MongoDB aggregations and pandas reductions on every request.
+
+External library versions:
+redis==4.5.4
+orjson==3.8.3
+"""
+
+# Human Tasks:
+# 1. Configure Redis connection string in environment variables (REDIS_URL)
+# 2. Verify Redis maxmemory policy is set to allkeys-lru for cache workloads
+# 3. Set up monitoring for cache hit ratio and eviction rates
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+from typing import Optional
+
+import orjson
+import redis.asyncio as aioredis
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# Version-namespaced key prefix so the whole cache can be invalidated per-version
+CACHE_KEY_PREFIX = 'analytics:v1'
+
+# Default TTL aligned with the Cache-Control max-age advertised by the middleware
+DEFAULT_CACHE_TTL = 30
+
+# Short-lived lock TTL used to prevent thundering-herd recomputation
+LOCK_TTL_SECONDS = 5
+
+# Module-level client shared across requests within a worker
+_redis_client: Optional[aioredis.Redis] = None
+
+
+async def initialize_cache() -> None:
+    """Initialize the shared Redis client for response caching.
+
+    Caching is an optimization, not a dependency: when Redis is unreachable
+    the client is left unset and every @cached handler runs uncached, so the
+    service still boots and serves requests.
+    Addresses requirement: Support for 10,000+ concurrent users with sub-second response times
+    """
+    global _redis_client
+    redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    client = aioredis.from_url(
+        redis_url,
+        encoding='utf-8',
+        max_connections=100,
+        socket_timeout=1.0,
+        socket_connect_timeout=1.0
+    )
+    try:
+        await client.ping()
+    except (aioredis.RedisError, OSError) as e:
+        logger.warning(f"Cache unavailable, serving uncached: {str(e)}")
+        await client.close()
+        _redis_client = None
+        return
+    _redis_client = client
+    logger.info("Cache connection established")
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client during application shutdown."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
+
+
+def get_cache_client() -> Optional[aioredis.Redis]:
+    """Return the shared Redis client, or None when caching is not initialized."""
+    return _redis_client
+
+
+def build_cache_key(namespace: str, *components) -> str:
+    """Build a namespaced cache key by hashing the request-identifying components.
+
+    Args:
+        namespace (str): Endpoint namespace (e.g. 'fleet', 'delivery')
+        *components: Request parameters identifying the cached result
+
+    Returns:
+        str: Versioned cache key of the form analytics:v1:<namespace>:<hash>
+    """
+    serialized = orjson.dumps(components, option=orjson.OPT_SORT_KEYS, default=str)
+    digest = hashlib.sha1(serialized).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{namespace}:{digest}"
+
+
+def cached(namespace: str, ttl: int = DEFAULT_CACHE_TTL):
+    """Decorator caching serialized handler responses in Redis.
+
+    Hashes the handler arguments into a versioned Redis key, returns the cached
+    serialized body on hit, and on miss runs the handler and stores its body with
+    the configured TTL. A short NX lock key prevents concurrent recomputation of
+    the same expensive aggregation (thundering herd).
+
+    Args:
+        namespace (str): Key namespace for the endpoint
+        ttl (int): Cache entry lifetime in seconds
+
+    Returns:
+        Decorated handler serving cached responses when available
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = get_cache_client()
+            if client is None:
+                return await func(*args, **kwargs)
+
+            cache_key = build_cache_key(namespace, args, kwargs)
+            lock_key = f"{cache_key}:lock"
+
+            try:
+                # Serve stored bytes directly; no decode/re-encode on the hit path
+                cached_body = await client.get(cache_key)
+                if cached_body is not None:
+                    return Response(content=cached_body, media_type='application/json')
+
+                # Only one worker recomputes; others briefly poll for the result
+                if not await client.set(lock_key, b'1', nx=True, ex=LOCK_TTL_SECONDS):
+                    for _ in range(3):
+                        await asyncio.sleep(0.05)
+                        cached_body = await client.get(cache_key)
+                        if cached_body is not None:
+                            return Response(content=cached_body, media_type='application/json')
+            except aioredis.RedisError as e:
+                logger.warning(f"Cache lookup failed, serving uncached: {str(e)}")
+                return await func(*args, **kwargs)
+
+            response = await func(*args, **kwargs)
+
+            try:
+                if response.status_code == 200:
+                    await client.set(cache_key, response.body, ex=ttl)
+                await client.delete(lock_key)
+            except aioredis.RedisError as e:
+                logger.warning(f"Cache store failed: {str(e)}")
+
+            return response
+        return wrapper
+    return decorator
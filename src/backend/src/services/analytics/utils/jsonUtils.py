@@ -0,0 +1,30 @@
+"""
+JSON serialization helpers for analytics API responses.
+Wraps orjson with the options the analytics payloads need: native numpy
+scalar/array encoding and timestamp dictionary keys.
+
+External library versions:
+orjson==3.8.3
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class AnalyticsJSONResponse(ORJSONResponse):
+    """ORJSON response tuned for analytics payloads.
+
+    OPT_SERIALIZE_NUMPY passes numpy scalars and arrays straight to the C
+    encoder, OPT_NON_STR_KEYS accepts the pandas Timestamp bucket keys used
+    by the statistics dictionaries, and remaining unknown types fall back to
+    their str() form.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
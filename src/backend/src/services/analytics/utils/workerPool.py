@@ -0,0 +1,64 @@
+"""
+Process pool management for CPU-heavy analytics workloads.
+Keeps pandas/numpy-heavy computation off the event loop so handlers stay
+responsive while DataFrame construction and aggregation run on other cores.
+
+External library versions: standard library only
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Module-level pool shared across requests within a worker
+_worker_pool: Optional[ProcessPoolExecutor] = None
+
+
+def initialize_worker_pool(max_workers: Optional[int] = None) -> None:
+    """Initialize the shared process pool for CPU-bound analytics work.
+    Addresses requirement: Support for 10,000+ concurrent users with sub-second response times
+
+    Args:
+        max_workers (int, optional): Pool size, defaults to the CPU count
+    """
+    global _worker_pool
+    _worker_pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+    logger.info("Worker pool initialized")
+
+
+def shutdown_worker_pool() -> None:
+    """Shut down the shared process pool during application shutdown."""
+    global _worker_pool
+    if _worker_pool is not None:
+        _worker_pool.shutdown(wait=False)
+        _worker_pool = None
+
+
+def get_worker_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared process pool, or None when not initialized."""
+    return _worker_pool
+
+
+async def run_cpu_bound(func, *args):
+    """Run a CPU-bound callable in the worker pool without blocking the event loop.
+
+    Falls back to inline execution when the pool is not initialized (e.g. in
+    unit tests exercising handlers directly).
+
+    Args:
+        func: Picklable module-level callable
+        *args: Positional arguments passed to the callable
+
+    Returns:
+        The callable's result
+    """
+    pool = get_worker_pool()
+    if pool is None:
+        return func(*args)
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(pool, func, *args)
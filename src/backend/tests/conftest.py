@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration for the backend Python test suites.
+"""
+
+
+def pytest_configure(config):
+    """Register the custom markers used across the analytics tests."""
+    config.addinivalue_line(
+        "markers",
+        "performance: mark test for performance validation"
+    )
+    config.addinivalue_line(
+        "markers",
+        "integration: mark test requiring database integration"
+    )